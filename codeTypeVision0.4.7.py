@@ -21,6 +21,8 @@ pip install PyQt5>=5.15.0 pygments>=2.10.0 tqdm>=4.64.0
 import os
 import subprocess
 import sys
+import threading
+import multiprocessing
 
 from typing import List, Tuple, Union
 
@@ -40,6 +42,7 @@ from PyQt5.QtWidgets import QApplication
 from PyQt5.QtGui import QPainter, QColor, QFont, QFontMetrics, QImage #, QGuiApplication, QPixmap
 
 import asyncio
+from concurrent.futures import ProcessPoolExecutor
 #import aiofiles # 未使用
 from tqdm.asyncio import tqdm
 
@@ -53,9 +56,13 @@ except: print("winsound未导入, 无法使用提示音提示!!")
 
 #region 全局变量声明
 MAX_CONCURRENT = 50 # 最大异步任务并发量; **可以进行修改**
+MAX_WORKERS = os.cpu_count() or 1 # 帧渲染进程数(多核并行); **可以进行修改**, 1 表示只在主进程内渲染
+SHARDS_PER_WORKER = 4 # 每个渲染进程平均分到的帧分片数, 分片越多负载越均衡
 
 THIS_PATH = os.path.dirname(__file__)+"\\" # 这是本文件父文件夹路径
 nowtime = lambda: datetime.now().strftime("[%Y.%m.%d_%H:%M:%S]") # 简单输出时间
+if multiprocessing.parent_process() is not None: # 渲染子进程不需要显示, 使用离屏平台
+	os.environ["QT_QPA_PLATFORM"] = "offscreen"
 app = QApplication([])  # 必须的Qt应用程序实例
 #endregion
 
@@ -297,6 +304,77 @@ class CodeLineRenderer:
 		
 		return font
 
+class FrameComposer:
+	"""
+	帧合成器
+
+	由 (真行号, 展示索引, 真行高, 相机坐标, 光标坐标) 合成一帧画面
+	只持有背景图, 光标图与原始代码图片目录, 不依赖 Field 的模拟状态, 因此可以在渲染子进程中独立重建
+	"""
+
+	def __init__(self, size:tuple[int, int], bgimg:QImage, work_dir:str, render:CodeLineRenderer):
+		"""
+		Args:
+			size: 视频分辨率(宽×高)
+			bgimg: 与分辨率一致的背景图
+			work_dir: 原始代码图片集目录(workDir0)
+			render: 已设置好字号的渲染器, 用于生成光标图像
+		"""
+		self.w, self.h = size
+		self.bgimg = bgimg
+		self.work_dir = work_dir
+		self.render = render
+		self.cursorImg = render.render_line([("│", Field.HC["b"])]) # 光标图像
+
+	def compose(self,
+				nowLi:int,	      # 现在(真)行号
+				nowShowIndex:int, # 现在展示的帧索引(对应已保存的图片)
+				rblh:float,	  # 真行高(不取整)
+				nowCamPos:tuple[int,int],	 # 现在相机相对坐标(取整)
+				nowCurPos:tuple[float,float]  # 现在光标相对坐标(不取整), 为None表示不显示光标
+		) -> QImage: # 照相(takePhoto) -> 生帧
+		rrblh = round(rblh)
+		limg = QImage(self.w, rrblh, QImage.Format_ARGB32)
+		limg.fill(QColor(*Field.HC["w"][:-1],20)) # 这是用于高亮正在打字的行
+
+		#fli = f"{nowLi:0{4}d}" # 格式化行号
+		nowcodeimg = concatenate_images([
+				QImage(os.path.join(self.work_dir, f"{nowLi-1:0{4}d}.png")),
+				QImage(os.path.join(self.work_dir, f"{nowLi:0{4}d}-{nowShowIndex:0{5}d}.png"))
+			])
+
+		x, y = nowCamPos
+		bg = paste_rgba_to_rgba(self.bgimg, limg, 0, y + round((nowLi-1) * rblh))
+		fg = QImage(self.w, self.h, QImage.Format_ARGB32) # 前景
+		fg = paste_rgba_to_rgba(fg,
+						nowcodeimg.scaledToHeight(round( (nowLi+1) * rblh) ),
+						x, y - rrblh) # 放置代码图片
+
+		if nowCurPos is not None: # 绘制光标
+			cx, cy = nowCurPos
+			cursorImg = self.cursorImg.scaledToHeight(rrblh)
+			w, h = cursorImg.width(), cursorImg.height()
+			fg = paste_rgba_to_rgba(fg, cursorImg, round(cx-w/2), round(cy-h/2)) # 光标图片居中放置
+
+		return paste_rgba_to_rgba(bg, blur_glow(fg), 0 ,0) # 代码图片 模糊发光
+
+	def assets(self) -> dict:
+		"""可序列化的共享资源, 用于在渲染子进程中重建合成器"""
+		return {
+			"size": (self.w, self.h),
+			"bgimg": pack_qimage(self.bgimg),
+			"work_dir": self.work_dir,
+			"fonts": (self.render.font0.toString(), self.render.font1.toString()) # 含字号
+		}
+
+	@classmethod
+	def from_assets(cls, assets:dict) -> "FrameComposer":
+		"""由 assets() 的结果重建合成器(会新建该进程自己的渲染器)"""
+		fonts = [QFont() for _ in assets["fonts"]]
+		for font, desc in zip(fonts, assets["fonts"]): font.fromString(desc)
+		render = CodeLineRenderer(font0=fonts[0], font1=fonts[1])
+		return cls(assets["size"], unpack_qimage(assets["bgimg"]), assets["work_dir"], render)
+
 class Field:
 	"""
 	场域类 - 代码转视频的核心控制器
@@ -355,7 +433,9 @@ class Field:
 			head_txt:str = None,								# 头文本
 			language:str = "Python",							# 代码语言
 			resolution:tuple[int, int] = (1920, 1080),			# 分辨率(宽×高)
-			render:CodeLineRenderer = CodeLineRenderer()		# 用于绘图的render 主要是为了设置字体
+			render:CodeLineRenderer = CodeLineRenderer(),		# 用于绘图的render 主要是为了设置字体
+			output_mode:str = "pipe",							# 输出模式: "pipe"直接流式编码; "png"保存帧序列(调试)
+			workers:int = None									# 帧渲染进程数, 默认 MAX_WORKERS; 1 表示在主进程内渲染
 		):
 		"""
 		初始化场域对象
@@ -375,15 +455,21 @@ class Field:
 			language: 代码语言
 			resolution: 视频分辨率(宽度, 高度)
 			render: 用于绘图
+			output_mode: 输出模式, "pipe" 将帧按序写入ffmpeg标准输入(不落盘); "png" 保存 Frame%d.png 序列后再合成(调试用)
+			workers: 帧渲染进程数, 每个子进程有独立的Qt实例; None 表示使用 MAX_WORKERS
 		"""
 		self.txt = text.replace(" "*4,"\t") # 使视觉感觉如TAB键
 		# 因为我会 在本代码 频繁把" "*4对应的字符串换成"\t"(缩进需要); 所以为了不改变上述代码, 必须要写成" "*4
 		self.output = video_output_dir
 		self.workDir = os.path.join(video_output_dir, "CTV_"+os.path.splitext(video_name)[0])  # 工作目录(帧图集)
 		self.workDir0 = os.path.join(self.workDir,"0") # 原始代码图片集
-		self.workDir1 = os.path.join(self.workDir,"1") # 视频帧集
+		self.workDir1 = os.path.join(self.workDir,"1") # 视频帧集(仅 png 调试模式使用)
 
 		self.name = video_name
+		if output_mode not in ("pipe", "png"): raise ValueError(f"未知输出模式: {output_mode}")
+		self.outputMode = output_mode # "pipe": 帧直接流入ffmpeg; "png": 保存帧序列(调试用)
+		self.frameSink = None # 帧接收器, 在 generateFrames 中打开
+		self.workers = max(1, workers if workers else MAX_WORKERS) # 帧渲染进程数
 
 		self.frame = frame
 		self.frame2 = round(frame/2)  # 半帧,防止重复运算
@@ -433,7 +519,6 @@ class Field:
 		self.isB = True  # 缩放是否到未达极限 # 还有一处需要它进行判断
 		self.blh = self.render.render_line([("A0中", (0, 0, 0, 255))]).height() # 获取基础原始行高
 
-		self.cursorImg = self.render.render_line([("│", Field.HC["b"])]) # 光标图像
 		self.headImg = self.render.render_line([(self.headTxt, Field.HC["G"])]) # 头文本图像
 		
 		# 布局参数
@@ -463,6 +548,7 @@ class Field:
 			self.bgimg = QImage(self.w, self.h, QImage.Format_ARGB32)
 			self.bgimg.fill(QColor(*Field.HC["D"]))  # 纯色背景图
 		#self.cvimg = cover_img_path 设置封面存在问题, 可能是不了解ffmpeg方法
+		self.composer = FrameComposer(self.wh, self.bgimg, self.workDir0, self.render) # 帧合成器
 		
 		# 初始化
 		print(nowtime() + " DATA预计算...")
@@ -558,7 +644,6 @@ class Field:
 		if not os.path.exists(self.workDir):
 			os.makedirs(self.workDir)
 			os.makedirs(self.workDir0)
-			os.makedirs(self.workDir1)
 			print(f"{nowtime()} 已创建文件夹: {self.workDir}")
 
 		else:
@@ -570,6 +655,9 @@ class Field:
 			
 			print("	持续运行...")
 
+		if self.outputMode == "png": # 只有调试模式才需要帧集文件夹
+			os.makedirs(self.workDir1, exist_ok=True)
+
 	def supplementRest(self, ix:int, num:int, cursorValue:int=0):
 		"""
 		补充休止时间帧数
@@ -872,35 +960,18 @@ class Field:
 					rblh:float,	  # 真行高(不取整)
 					nowCamPos:tuple[int,int],	 # 现在相机相对坐标(取整)
 					nowCurPos:tuple[float,float]  # 现在光标相对坐标(不取整), 为None表示不显示光标
-		): # 照相(takePhoto) -> 生帧
-		rrblh = round(rblh)
-		limg = QImage(self.w, rrblh, QImage.Format_ARGB32)
-		limg.fill(QColor(*Field.HC["w"][:-1],20)) # 这是用于高亮正在打字的行
+		) -> QImage: # 照相(takePhoto) -> 生帧
+		return self.composer.compose(nowLi, nowShowIndex, rblh, nowCamPos, nowCurPos)
 
-		#fli = f"{nowLi:0{4}d}" # 格式化行号
-		nowcodeimg = concatenate_images([
-				QImage(os.path.join(self.workDir0, f"{nowLi-1:0{4}d}.png")),
-				QImage(os.path.join(self.workDir0, f"{nowLi:0{4}d}-{nowShowIndex:0{5}d}.png"))
-			])
-
-		x, y = nowCamPos
-		bg = paste_rgba_to_rgba(self.bgimg, limg, 0, y + round((nowLi-1) * rblh))
-		fg = QImage(*self.wh, QImage.Format_ARGB32) # 前景
-		fg = paste_rgba_to_rgba(fg,
-						nowcodeimg.scaledToHeight(round( (nowLi+1) * rblh) ),
-						x, y - rrblh) # 放置代码图片
-
-		if nowCurPos is not None: # 绘制光标
-			cx, cy = nowCurPos
-			cursorImg = self.cursorImg.scaledToHeight(rrblh)
-			w, h = cursorImg.width(), cursorImg.height()
-			fg = paste_rgba_to_rgba(fg, cursorImg, round(cx-w/2), round(cy-h/2)) # 光标图片居中放置
+	def planFrames(self) -> list: # 预先计算每一帧的相机与光标, 得到帧计划
+		"""
+		运行缩放与相机模拟, 得到每一帧的合成参数
 
-		frame_img = paste_rgba_to_rgba(bg, blur_glow(fg), 0 ,0) # 代码图片 模糊发光
-		frame_img.save(os.path.join(self.workDir1, f"Frame{nowIndex}.png"))
-	
-	async def generateFrames(self): # 异步生成帧图片
-		tasks = [None for _ in range(self.length)] # 异步任务
+		Returns:
+			list: 帧计划, 第index项为 (真行号, 展示索引, 真行高, 相机相对坐标, 光标相对坐标)
+				即 FrameComposer.compose 的参数
+		"""
+		plan = [None for _ in range(self.length)]
 		self.camm = (self.cx, self.cy) # 初始化坐标
 		self.nowi = 0 # 要得到的图像帧索引位置
 		for self.index in range(self.length):
@@ -917,9 +988,8 @@ class Field:
 
 			if self.inDataL[self.index] is not None: self.nowi = self.index # 继承显示图片索引
 			
-			tasks[self.index] = self.takeFrame(
+			plan[self.index] = (
 						self.li, # 真行号
-						self.index,
 						self.nowi,
 						self.rblh, # 真行高(不取整)
 						(
@@ -934,21 +1004,52 @@ class Field:
 
 		self.cl = None
 		self.inDataL = None
+		return plan
 
-		print(f"{nowtime()} {self.workDir1} 开始生成帧集...")
-		
-		with tqdm(total=len(tasks)) as pbar:
-			async def track_task(task):
-				result = await limit_wrap(task) # 限制包装
-				pbar.update(1)  # 更新进度条
-				return result
-			
-			tracked_tasks = [track_task(t) for t in tasks]
-			await asyncio.gather(*tracked_tasks)
+	async def generateFrames(self): # 异步生成帧图片
+		plan = self.planFrames()
 
+		self.frameSink = self.openFrameSink()
+		print(f"{nowtime()} 开始生成帧集...")
+
+		with tqdm(total=len(plan)) as pbar:
+			if self.workers > 1: # 多进程渲染
+				await self.renderFramesParallel(plan, pbar)
+
+			else: # 主进程内渲染
+				async def track_task(index, task):
+					img = await limit_wrap(task) # 限制包装
+					self.frameSink.put(index, img) # 交给接收器(乱序完成的帧会在其中重排)
+					pbar.update(1)  # 更新进度条
+
+				tracked_tasks = [track_task(i, self.takeFrame(row[0], i, *row[1:])) for i, row in enumerate(plan)]
+				await asyncio.gather(*tracked_tasks)
 
 		print(f"{nowtime()} 帧集生成完毕.")
 
+	async def renderFramesParallel(self, plan:list, pbar): # 多进程分片渲染
+		"""
+		将帧时间线切分为连续分片, 交由进程池渲染
+
+		每个子进程启动时一次性收到合成器资源与整个帧计划, 之后每个任务只传递分片的起止索引
+
+		Args:
+			plan: planFrames 得到的帧计划
+			pbar: 进度条
+		"""
+		pngDir = self.workDir1 if self.outputMode == "png" else None # png模式由子进程直接保存
+		shards = split_shards(len(plan), self.workers * SHARDS_PER_WORKER)
+		loop = asyncio.get_running_loop()
+
+		with frame_worker_pool(min(self.workers, len(shards)), self.composer.assets(), plan, pngDir) as pool:
+			async def track_shard(start, stop):
+				frames = await loop.run_in_executor(pool, render_frame_shard, start, stop)
+				for i, data in enumerate(frames):
+					self.frameSink.put(start + i, data)
+				pbar.update(stop - start)  # 更新进度条
+
+			await asyncio.gather(*[track_shard(*shard) for shard in shards])
+
 	def calculatePos(self, aim:tuple[float, float]):
 		"""
 		计算相机位置(阻尼版本)
@@ -1011,14 +1112,21 @@ class Field:
 			self.isB = False
 		else: self.zoom = zoom
 
+	def openFrameSink(self): # 打开帧接收器
+		if self.outputMode == "png":
+			return PNGSequenceWriter(self.workDir1)
+		return FFmpegPipeWriter(os.path.join(self.output, self.name), *self.wh, self.frame)
+
 	def creatVideo(self): # 创建视频
 		print(nowtime() + " 开始合成视频...")
 		p = os.path.join(self.output, self.name)
-		success = create_video(self.workDir1,
-					p,
-					self.frame,
-					end_index = self.length-1 # 因为从0开始
-			)
+		if self.outputMode == "png":
+			success = create_video(self.workDir1,
+						p,
+						self.frame,
+						end_index = self.length-1 # 因为从0开始
+				)
+		else: success = self.frameSink.close() # 帧已流入ffmpeg, 只需等待编码结束
 		
 		print(f"\n{nowtime()} "
 			+ (f"视频生成完成! -> {p}" if success else f"视频生成失败!!")
@@ -1359,7 +1467,168 @@ def create_video(work_dir, video_name, frame_rate=30, start_index=0, end_index=N
 	except Exception as e:
 		print(f"❌ 执行失败: {e}")
 		return False
-	
+
+def qimage_to_bgra(img:QImage) -> bytes:
+	"""
+	取出QImage的原始像素(小端序下为 bgra 排列), 用于写入ffmpeg的rawvideo管道
+
+	Args:
+		img: 任意格式的QImage
+
+	Returns:
+		bytes: 逐行紧密排列的32位像素数据
+	"""
+	if img.format() not in (QImage.Format_ARGB32, QImage.Format_RGB32, QImage.Format_ARGB32_Premultiplied):
+		img = img.convertToFormat(QImage.Format_ARGB32) # 帧本身不透明, 预乘与否不影响像素
+	ptr = img.constBits()
+	ptr.setsize(img.sizeInBytes())
+	return ptr.asstring()
+
+def pack_qimage(img:QImage) -> tuple:
+	"""将QImage打包为可pickle的元组(PyQt5的QImage不能直接序列化), 用于传给子进程"""
+	ptr = img.constBits()
+	ptr.setsize(img.sizeInBytes())
+	return (img.width(), img.height(), img.bytesPerLine(), int(img.format()), ptr.asstring())
+
+def unpack_qimage(packed:tuple) -> QImage:
+	"""pack_qimage 的逆操作"""
+	w, h, bpl, fmt, data = packed
+	return QImage(data, w, h, bpl, QImage.Format(fmt)).copy() # copy 使图像拥有自己的内存
+
+class FFmpegPipeWriter:
+	"""
+	ffmpeg 管道写入器
+
+	启动一个长驻的ffmpeg进程, 将帧以 rawvideo 格式按帧序写入其标准输入, 全程不落盘
+	乱序完成的帧先进入重排缓冲区, 等其之前的帧全部写出后再依次写出
+	"""
+
+	def __init__(self, video_path:str, width:int, height:int, frame_rate:int=30,
+				codec='libx264', preset='medium', crf=0, pix_fmt='yuv420p'
+			):
+		"""
+		启动ffmpeg进程
+
+		Args:
+			video_path: 输出视频路径(带扩展名)
+			width, height: 帧分辨率
+			frame_rate: 帧率
+			codec: 视频编码器
+			preset: 编码预设
+			crf: 质量参数(0-51,越小质量越好)
+			pix_fmt: 输出像素格式
+		"""
+		self.video_path = video_path
+		self.frame_bytes = width * height * 4 # 每帧字节数(32位像素)
+		self.next_index = 0 # 下一个应写出的帧索引
+		self.pending = {}   # 重排缓冲区 {帧索引: 像素数据}
+		self.max_pending = 0 # 重排缓冲区峰值, 用于观察乱序程度
+		self.failed = False
+		self.logtext = ""
+
+		self.cmd = [
+			'ffmpeg',
+			'-y',  # 覆盖输出文件
+			'-loglevel', 'warning', '-nostats',
+			'-f', 'rawvideo',  # 原始像素输入
+			'-pix_fmt', 'bgra' if sys.byteorder == "little" else 'argb',  # QImage.Format_ARGB32 的内存排列
+			'-s', f"{width}x{height}",
+			'-framerate', str(frame_rate),  # 输入帧率
+			'-i', '-',  # 从标准输入读取
+			'-c:v', codec,  # 视频编码器
+			'-preset', preset,  # 编码预设
+			'-crf', str(crf),  # 质量参数
+			'-pix_fmt', pix_fmt,  # 像素格式
+			video_path
+		]
+		print(f"🔧 FFmpeg命令: {' '.join(self.cmd)}")
+
+		try:
+			self.process = subprocess.Popen(
+				self.cmd,
+				stdin=subprocess.PIPE,
+				stdout=subprocess.DEVNULL,
+				stderr=subprocess.PIPE
+			)
+		except FileNotFoundError:
+			print("❌ 找不到ffmpeg, 请确保已安装并添加到PATH")
+			raise
+
+		# 单独线程读取日志, 防止stderr管道写满导致ffmpeg阻塞
+		self._log_thread = threading.Thread(target=self._read_log, daemon=True)
+		self._log_thread.start()
+
+	def _read_log(self):
+		for line in self.process.stderr:
+			self.logtext += line.decode('utf-8', errors='replace')
+
+	def put(self, index:int, img:Union[QImage, bytes]):
+		"""
+		提交一帧; 若其之前的帧都已写出则立即写出, 否则进入重排缓冲区
+
+		Args:
+			index: 帧索引(从0开始)
+			img: 帧图像(或 qimage_to_bgra 得到的像素数据), 分辨率需与初始化时一致
+		"""
+		if index < self.next_index or index in self.pending:
+			raise ValueError(f"重复提交帧: {index}")
+		data = img if isinstance(img, bytes) else qimage_to_bgra(img)
+		if len(data) != self.frame_bytes:
+			raise ValueError(f"帧{index}分辨率与视频不一致")
+
+		self.pending[index] = data
+		self.max_pending = max(self.max_pending, len(self.pending))
+		while self.next_index in self.pending: # 写出所有已连续的帧
+			self._write(self.pending.pop(self.next_index))
+			self.next_index += 1
+
+	def _write(self, data:bytes):
+		if self.failed: return
+		try: self.process.stdin.write(data)
+		except (BrokenPipeError, OSError): # ffmpeg 提前退出, 在 close 中报告
+			self.failed = True
+
+	def close(self) -> bool:
+		"""
+		关闭管道并等待ffmpeg完成编码
+
+		Returns:
+			bool: 是否成功
+		"""
+		if self.pending:
+			print(f"❌ 缺少帧: {self.next_index} (另有{len(self.pending)}帧滞留在重排缓冲区)")
+			self.failed = True
+		try: self.process.stdin.close()
+		except (BrokenPipeError, OSError): self.failed = True
+		self.process.wait()
+		self._log_thread.join()
+
+		if self.process.returncode == 0 and not self.failed and os.path.exists(self.video_path):
+			file_size = os.path.getsize(self.video_path)
+			print(f"✅ 视频合成完成: {self.video_path}")
+			print(f"📁 文件大小: {file_size:,} 字节 ({file_size/1024/1024:.2f} MB)")
+			return True
+
+		print("-"*10+"\n"+self.logtext+"-"*10)
+		print(f"\n❌ FFmpeg失败,返回码: {self.process.returncode}")
+		return False
+
+class PNGSequenceWriter:
+	"""
+	PNG帧序列写入器 (调试用)
+
+	与 FFmpegPipeWriter 接口一致, 将每帧保存为 Frame{index}.png, 之后交由 create_video 合成
+	"""
+
+	def __init__(self, work_dir:str):
+		self.work_dir = work_dir
+
+	def put(self, index:int, img:QImage):
+		img.save(os.path.join(self.work_dir, f"Frame{index}.png"))
+
+	def close(self) -> bool:
+		return True
+
 	#endregion
 
 	#region 异步相关
@@ -1370,6 +1639,55 @@ async def limit_wrap(task): # 异步限制包装
 	
 	#endregion
 
+	#region 多进程渲染
+_frame_worker = None # 渲染子进程内的状态: (合成器, 帧计划, png输出目录)
+
+def split_shards(length:int, num:int) -> list:
+	"""将 [0, length) 切分为至多 num 个连续分片, 返回 [(start, stop), ...]"""
+	size = max(1, ceil(length / max(1, num)))
+	return [(start, min(start + size, length)) for start in range(0, length, size)]
+
+def frame_worker_pool(workers:int, assets:dict, plan:list, png_dir:str=None) -> ProcessPoolExecutor:
+	"""
+	创建帧渲染进程池
+
+	使用 spawn 方式启动, 每个子进程拥有独立的 QApplication 与 CodeLineRenderer;
+	共享资源与帧计划只在子进程初始化时传递一次
+
+	Args:
+		workers: 进程数
+		assets: FrameComposer.assets() 的结果
+		plan: 帧计划
+		png_dir: 不为None时子进程直接将帧保存为PNG(调试模式)
+	"""
+	return ProcessPoolExecutor(
+		max_workers=workers,
+		mp_context=multiprocessing.get_context("spawn"), # fork 复制Qt状态不安全, 且与Windows行为一致
+		initializer=_init_frame_worker,
+		initargs=(assets, plan, png_dir)
+	)
+
+def _init_frame_worker(assets:dict, plan:list, png_dir:str):
+	global _frame_worker
+	_frame_worker = (FrameComposer.from_assets(assets), plan, png_dir)
+
+def render_frame_shard(start:int, stop:int) -> list:
+	"""
+	(子进程内) 渲染帧分片 [start, stop)
+
+	Returns:
+		list: 每帧的像素数据(qimage_to_bgra); png调试模式下帧已保存, 返回空列表
+	"""
+	composer, plan, png_dir = _frame_worker
+	frames = []
+	for index in range(start, stop):
+		img = composer.compose(*plan[index])
+		if png_dir: img.save(os.path.join(png_dir, f"Frame{index}.png"))
+		else: frames.append(qimage_to_bgra(img))
+	return frames
+	
+	#endregion
+
 	#region 实用函数
 
 def quick_open(txt_input_path:str) -> str: # 快速打开文本文件